@@ -1,6 +1,7 @@
 """
 Streamlit application for Car Management System
 """
+from datetime import date
 import streamlit as st
 import pandas as pd
 from car import Car
@@ -190,14 +191,22 @@ def show_search():
     results = []
 
     if search_type == "Make":
-        make = st.text_input("Enter make", placeholder="e.g., Toyota")
-        if st.button("Search") and make:
-            results = st.session_state.car_manager.search_by_make(make)
+        make = st.text_input("Enter make", placeholder="e.g., Toyota or merc",
+                             help="Partial names and typos are matched. Press Enter to search.")
+        if make:
+            suggestions = st.session_state.car_manager.suggest(make, field='make')
+            if suggestions:
+                st.caption("Suggestions: " + ", ".join(suggestions))
+            results = st.session_state.car_manager.search(make, field='make')
 
     elif search_type == "Model":
-        model = st.text_input("Enter model", placeholder="e.g., Camry")
-        if st.button("Search") and model:
-            results = st.session_state.car_manager.search_by_model(model)
+        model = st.text_input("Enter model", placeholder="e.g., Camry or Model3",
+                              help="Partial names and typos are matched. Press Enter to search.")
+        if model:
+            suggestions = st.session_state.car_manager.suggest(model, field='model')
+            if suggestions:
+                st.caption("Suggestions: " + ", ".join(suggestions))
+            results = st.session_state.car_manager.search(model, field='model')
 
     elif search_type == "Year Range":
         col1, col2 = st.columns(2)
@@ -280,6 +289,22 @@ def show_car_details():
             st.write(f"**Age:** {car.get_age()} years")
             st.write(f"**Service Records:** {len(car.service_history)}")
 
+        with st.expander("Update Mileage"):
+            with st.form("mileage_form"):
+                new_mileage = st.number_input("New mileage (miles)", min_value=float(car.mileage),
+                                              value=float(car.mileage), step=100.0)
+                today = date.today()
+                last_reading = car.mileage_history[-1][0] if car.mileage_history else today
+                reading_date = st.date_input("Reading date", value=max(today, last_reading),
+                                             min_value=last_reading)
+
+                if st.form_submit_button("Update Mileage"):
+                    try:
+                        car.update_mileage(new_mileage, reading_date)
+                        st.success("Mileage updated!")
+                    except ValueError as error:
+                        st.error(str(error))
+
         st.markdown("---")
 
         # Service history section
@@ -371,6 +396,25 @@ def show_analytics():
     fig_comparison.update_layout(barmode='group', title="Price Depreciation Comparison")
     st.plotly_chart(fig_comparison, use_container_width=True)
 
+    # Fleet value over time
+    st.subheader("Fleet Value Over Time")
+    today = date.today()
+    col1, col2 = st.columns(2)
+    with col1:
+        start = st.date_input("From", value=date(today.year - 5, 1, 1))
+    with col2:
+        end = st.date_input("To", value=date(today.year + 2, 12, 1))
+
+    if start <= end:
+        df_history = st.session_state.car_manager.get_value_history(start, end)
+        fig_history = px.line(df_history, x='month', y='total_value',
+                              hover_data=['cars', 'average_mileage'],
+                              title="Projected Fleet Value by Month",
+                              labels={'month': 'Month', 'total_value': 'Fleet Value ($)'})
+        st.plotly_chart(fig_history, use_container_width=True)
+    else:
+        st.warning("Start date must be before end date.")
+
 
 if __name__ == "__main__":
     main()
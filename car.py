@@ -1,8 +1,14 @@
 """
 Car class module for managing car objects
 """
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Callable, List, Optional, Tuple
+
+
+# Depreciation model shared with the fleet valuation engine
+AGE_DEPRECIATION_RATE = 0.15         # per year of age
+MILEAGE_DEPRECIATION_RATE = 0.0005   # per 1000 miles
+MAX_DEPRECIATION = 0.9
 
 
 class Car:
@@ -29,6 +35,9 @@ class Car:
         self.mileage = mileage
         self.owner: Optional[str] = None
         self.service_history = []
+        self.mileage_history: List[Tuple[date, float]] = [(date.today(), mileage)]
+        # Called with the car after each mileage update (e.g., by CarManager)
+        self.change_listeners: List[Callable[['Car'], None]] = []
 
     def __str__(self) -> str:
         """String representation of the car"""
@@ -44,19 +53,28 @@ class Car:
         current_year = datetime.now().year
         return current_year - self.year
 
-    def update_mileage(self, new_mileage: float) -> None:
+    def update_mileage(self, new_mileage: float,
+                       reading_date: Optional[date] = None) -> None:
         """
-        Update the car's mileage
+        Update the car's mileage and record the odometer reading
 
         Args:
             new_mileage: New mileage value
+            reading_date: Date of the odometer reading (default: today)
 
         Raises:
-            ValueError: If new mileage is less than current mileage
+            ValueError: If new mileage is less than current mileage, or the
+                reading is dated before the last recorded reading
         """
+        reading_date = reading_date or date.today()
         if new_mileage < self.mileage:
             raise ValueError("New mileage cannot be less than current mileage")
+        if self.mileage_history and reading_date < self.mileage_history[-1][0]:
+            raise ValueError("Reading date cannot be earlier than the last mileage reading")
         self.mileage = new_mileage
+        self.mileage_history.append((reading_date, new_mileage))
+        for listener in self.change_listeners:
+            listener(self)
 
     def add_service_record(self, service_type: str, cost: float,
                           description: str = "") -> None:
@@ -86,9 +104,9 @@ class Car:
         Calculate depreciation based on age and mileage
         Rough estimate: 15% per year + 0.05% per 1000 miles
         """
-        age_depreciation = self.get_age() * 0.15
-        mileage_depreciation = (self.mileage / 1000) * 0.0005
-        total_depreciation = min(age_depreciation + mileage_depreciation, 0.9)
+        age_depreciation = self.get_age() * AGE_DEPRECIATION_RATE
+        mileage_depreciation = (self.mileage / 1000) * MILEAGE_DEPRECIATION_RATE
+        total_depreciation = min(age_depreciation + mileage_depreciation, MAX_DEPRECIATION)
         return self.price * (1 - total_depreciation)
 
     def to_dict(self) -> dict:
@@ -103,6 +121,8 @@ class Car:
             'owner': self.owner,
             'age': self.get_age(),
             'current_value': round(self.get_depreciation(), 2),
-            'service_history': self.service_history
+            'service_history': self.service_history,
+            'mileage_history': [(day.isoformat(), miles)
+                                for day, miles in self.mileage_history]
         }
 
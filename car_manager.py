@@ -2,8 +2,12 @@
 Car Manager module for managing a collection of cars
 """
 import json
-from typing import List
+from datetime import date
+from typing import List, Optional
+import pandas as pd
 from car import Car
+from car_search import CarSearchIndex
+from fleet_valuation import FleetValuation
 
 
 class CarManager:
@@ -12,6 +16,10 @@ class CarManager:
     def __init__(self):
         """Initialize CarManager with an empty inventory"""
         self.inventory: List[Car] = []
+        self.search_index = CarSearchIndex()
+        self.valuation = FleetValuation(self.inventory)
+        # Bumped on every inventory change so cached valuations are refreshed
+        self.version = 0
 
     def add_car(self, car: Car) -> None:
         """
@@ -21,6 +29,10 @@ class CarManager:
             car: Car object to add
         """
         self.inventory.append(car)
+        self.search_index.add(car)
+        if self._on_car_changed not in car.change_listeners:
+            car.change_listeners.append(self._on_car_changed)
+        self.version += 1
 
     def remove_car(self, make: str, model: str, year: int) -> bool:
         """
@@ -37,9 +49,17 @@ class CarManager:
         for i, car in enumerate(self.inventory):
             if car.make == make and car.model == model and car.year == year:
                 self.inventory.pop(i)
+                if not any(other is car for other in self.inventory):
+                    self.search_index.remove(car)
+                    car.change_listeners.remove(self._on_car_changed)
+                self.version += 1
                 return True
         return False
 
+    def _on_car_changed(self, car: Car) -> None:
+        """Refresh cached valuations when a car in the inventory changes"""
+        self.version += 1
+
     def get_all_cars(self) -> List[Car]:
         """Get all cars in the inventory"""
         return self.inventory
@@ -52,6 +72,26 @@ class CarManager:
         """Search cars by model"""
         return [car for car in self.inventory if car.model.lower() == model.lower()]
 
+    def search(self, query: str, field: Optional[str] = None,
+               limit: Optional[int] = None) -> List[Car]:
+        """
+        Search cars by make and/or model with prefix and fuzzy matching
+
+        Args:
+            query: Text to search for (e.g., 'merc', 'Model3')
+            field: 'make' or 'model' to restrict the search, None for both
+            limit: Maximum number of cars to return (default: no limit)
+
+        Returns:
+            Matching cars, best matches first
+        """
+        return self.search_index.search(query, field, limit)
+
+    def suggest(self, query: str, field: Optional[str] = None,
+                limit: int = 10) -> List[str]:
+        """Suggest make/model names for partially typed text"""
+        return self.search_index.suggest(query, field, limit)
+
     def search_by_year_range(self, min_year: int, max_year: int) -> List[Car]:
         """Search cars within a year range"""
         return [car for car in self.inventory if min_year <= car.year <= max_year]
@@ -70,6 +110,21 @@ class CarManager:
             return 0.0
         return self.get_total_inventory_value() / len(self.inventory)
 
+    def get_value_history(self, start: date, end: date,
+                          as_of: Optional[date] = None) -> pd.DataFrame:
+        """
+        Get projected fleet value and mileage for each month in a date range
+
+        Args:
+            start: First month of the range
+            end: Last month of the range (inclusive)
+            as_of: Only odometer readings up to this date are used (default: today)
+
+        Returns:
+            DataFrame with 'month', 'total_value', 'cars' and 'average_mileage' columns
+        """
+        return self.valuation.value_by_month(start, end, self.version, as_of)
+
     def get_statistics(self) -> dict:
         """Get statistics about the car inventory"""
         if not self.inventory:
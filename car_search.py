@@ -0,0 +1,206 @@
+"""
+Search index module for fast prefix and fuzzy lookups of cars by make and model
+"""
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Set, Tuple
+from car import Car
+
+
+FIELDS = ('make', 'model')
+
+
+def normalize(text: str) -> str:
+    """Lowercase text, strip accents and drop everything except letters and digits"""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(char for char in decomposed
+                   if char.isalnum() and not unicodedata.combining(char))
+
+
+def trigrams(term: str) -> Set[str]:
+    """Split a normalized term into padded character trigrams"""
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CarSearchIndex:
+    """
+    In-memory index over car makes and models
+
+    Cars are grouped by their normalized make and model terms, so the cost of
+    a query depends on the number of distinct makes/models rather than on the
+    number of cars in the inventory.
+    """
+
+    def __init__(self, min_similarity: float = 0.3):
+        """
+        Initialize an empty search index
+
+        Args:
+            min_similarity: Minimum trigram similarity (0-1) for fuzzy matches
+        """
+        self.min_similarity = min_similarity
+        # field -> term -> {id(car): car}
+        self._postings: Dict[str, Dict[str, Dict[int, Car]]] = {f: {} for f in FIELDS}
+        # field -> trigram -> set of terms containing it
+        self._grams: Dict[str, Dict[str, Set[str]]] = {f: {} for f in FIELDS}
+        # field -> sorted list of terms, used for prefix lookups
+        self._terms: Dict[str, List[str]] = {f: [] for f in FIELDS}
+        # field -> term -> original spelling shown in suggestions
+        self._labels: Dict[str, Dict[str, str]] = {f: {} for f in FIELDS}
+        # id(car) -> terms the car was indexed under
+        self._indexed: Dict[int, Dict[str, str]] = {}
+
+    def __len__(self) -> int:
+        """Number of cars in the index"""
+        return len(self._indexed)
+
+    def add(self, car: Car) -> None:
+        """
+        Add a car to the index
+
+        Args:
+            car: Car object to index
+        """
+        key = id(car)
+        if key in self._indexed:
+            return
+        terms = {}
+        for field in FIELDS:
+            value = getattr(car, field)
+            term = normalize(value)
+            terms[field] = term
+            postings = self._postings[field]
+            if term not in postings:
+                postings[term] = {}
+                self._labels[field][term] = value
+                insort(self._terms[field], term)
+                for gram in trigrams(term):
+                    self._grams[field].setdefault(gram, set()).add(term)
+            postings[term][key] = car
+        self._indexed[key] = terms
+
+    def remove(self, car: Car) -> None:
+        """
+        Remove a car from the index
+
+        Args:
+            car: Car object to remove
+        """
+        terms = self._indexed.pop(id(car), None)
+        if terms is None:
+            return
+        for field, term in terms.items():
+            postings = self._postings[field]
+            cars = postings[term]
+            cars.pop(id(car), None)
+            if cars:
+                continue
+            del postings[term]
+            del self._labels[field][term]
+            sorted_terms = self._terms[field]
+            sorted_terms.pop(bisect_left(sorted_terms, term))
+            for gram in trigrams(term):
+                gram_terms = self._grams[field][gram]
+                gram_terms.discard(term)
+                if not gram_terms:
+                    del self._grams[field][gram]
+
+    def _prefix_terms(self, field: str, prefix: str) -> List[str]:
+        """Get all terms of a field starting with prefix"""
+        sorted_terms = self._terms[field]
+        start = bisect_left(sorted_terms, prefix)
+        end = bisect_left(sorted_terms, prefix + '\uffff')
+        return sorted_terms[start:end]
+
+    def _score_terms(self, field: str, query: str) -> Dict[str, float]:
+        """
+        Score every term of a field that matches the normalized query
+
+        Exact matches score 3, prefix matches score between 2 and 3 (shorter
+        completions rank higher), fuzzy matches score their trigram
+        similarity between min_similarity and 1.
+        """
+        scores: Dict[str, float] = {}
+        if query in self._postings[field]:
+            scores[query] = 3.0
+        for term in self._prefix_terms(field, query):
+            if term != query:
+                scores[term] = 2.0 + len(query) / len(term)
+
+        query_grams = trigrams(query)
+        overlaps: Dict[str, int] = {}
+        for gram in query_grams:
+            for term in self._grams[field].get(gram, ()):
+                overlaps[term] = overlaps.get(term, 0) + 1
+        for term, overlap in overlaps.items():
+            if term in scores:
+                continue
+            union = len(query_grams) + len(trigrams(term)) - overlap
+            similarity = overlap / union
+            if similarity >= self.min_similarity:
+                scores[term] = similarity
+        return scores
+
+    def _ranked_terms(self, query: str,
+                      field: Optional[str]) -> List[Tuple[float, str, str]]:
+        """Get (score, field, term) matches for a query, best first"""
+        if field is not None and field not in FIELDS:
+            raise ValueError(f"Unknown search field: {field}")
+        query = normalize(query)
+        if not query:
+            return []
+        fields = FIELDS if field is None else (field,)
+        matches = []
+        for name in fields:
+            for term, score in self._score_terms(name, query).items():
+                matches.append((score, name, term))
+        matches.sort(key=lambda match: (-match[0], match[2]))
+        return matches
+
+    def search(self, query: str, field: Optional[str] = None,
+               limit: Optional[int] = None) -> List[Car]:
+        """
+        Search cars by make and/or model, tolerating typos and partial input
+
+        Args:
+            query: Text to search for (e.g., 'merc', 'Model3', 'camri')
+            field: 'make' or 'model' to restrict the search, None for both
+            limit: Maximum number of cars to return (default: no limit)
+
+        Returns:
+            Matching cars, best matches first
+        """
+        results: List[Car] = []
+        seen: Set[int] = set()
+        for _, name, term in self._ranked_terms(query, field):
+            for key, car in self._postings[name][term].items():
+                if limit is not None and len(results) >= limit:
+                    return results
+                if key in seen:
+                    continue
+                seen.add(key)
+                results.append(car)
+        return results
+
+    def suggest(self, query: str, field: Optional[str] = None,
+                limit: int = 10) -> List[str]:
+        """
+        Suggest makes/models for typeahead
+
+        Args:
+            query: Partial text typed so far
+            field: 'make' or 'model' to restrict suggestions, None for both
+            limit: Maximum number of suggestions
+
+        Returns:
+            Make/model names in their original spelling, best matches first
+        """
+        suggestions: List[str] = []
+        for _, name, term in self._ranked_terms(query, field):
+            if len(suggestions) >= limit:
+                break
+            label = self._labels[name][term]
+            if label not in suggestions:
+                suggestions.append(label)
+        return suggestions
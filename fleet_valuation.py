@@ -0,0 +1,210 @@
+"""
+Fleet valuation module for projecting inventory value and mileage over time
+"""
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from car import (Car, AGE_DEPRECIATION_RATE, MILEAGE_DEPRECIATION_RATE,
+                 MAX_DEPRECIATION)
+
+
+# Mileage rate assumed for cars whose history gives no usable trend
+DEFAULT_DAILY_MILEAGE = 12000 / 365.25
+
+# Number of (as_of, start, end) results kept per inventory version
+CACHE_SIZE = 8
+
+# Offset between numpy datetime64 day numbers and date ordinals
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _month_start(day: date) -> date:
+    """Get the first day of the month containing day"""
+    return day.replace(day=1)
+
+
+class FleetValuation:
+    """
+    Time-series valuation of a car inventory
+
+    The inventory is flattened into column arrays once per inventory version.
+    Each car's mileage is modelled as a piecewise-linear curve starting at
+    0 miles on January 1st of its model year (or its first reading, if
+    earlier), passing through its odometer readings and extrapolated at its
+    lifetime average rate. Values are then
+    computed for the whole fleet one month at a time with numpy.
+    """
+
+    def __init__(self, cars: List[Car]):
+        """
+        Initialize the valuation engine
+
+        Args:
+            cars: Inventory list to value (read on every rebuild)
+        """
+        self.cars = cars
+        self._version: Optional[int] = None
+        self._snapshot: Optional[Dict[str, np.ndarray]] = None
+        self._cache: 'OrderedDict[Tuple[date, date, date], pd.DataFrame]' = OrderedDict()
+
+    def _build_snapshot(self) -> Dict[str, np.ndarray]:
+        """Flatten the inventory and its mileage histories into arrays"""
+        cars = self.cars
+        count = len(cars)
+        years = np.fromiter((car.year for car in cars), dtype=np.int64, count=count)
+        prices = np.fromiter((car.price for car in cars), dtype=np.float64, count=count)
+        lengths = np.fromiter((len(car.mileage_history) for car in cars),
+                              dtype=np.int64, count=count)
+        readings = [reading for car in cars for reading in car.mileage_history]
+        reading_days = np.fromiter((day.toordinal() for day, _ in readings),
+                                   dtype=np.int64, count=len(readings))
+        reading_miles = np.fromiter((miles for _, miles in readings),
+                                    dtype=np.float64, count=len(readings))
+
+        # Every car starts at 0 miles on January 1st of its model year, or at
+        # its first reading if recorded earlier (e.g., next year's models)
+        origin_days = (years - 1970).astype('datetime64[Y]').astype('datetime64[D]')
+        origin_days = origin_days.astype(np.int64) + _EPOCH_ORDINAL
+        recorded = lengths > 0
+        first_readings = np.cumsum(lengths) - lengths
+        origin_days[recorded] = np.minimum(origin_days[recorded],
+                                           reading_days[first_readings[recorded]])
+
+        return {
+            'years': years,
+            'prices': prices,
+            'origin_days': origin_days,
+            'reading_cars': np.repeat(np.arange(count), lengths),
+            'reading_days': reading_days,
+            'reading_miles': reading_miles,
+        }
+
+    def _get_snapshot(self, version: int) -> Dict[str, np.ndarray]:
+        """Get the inventory arrays, rebuilding them if the version changed"""
+        if self._snapshot is None or self._version != version:
+            self._snapshot = self._build_snapshot()
+            self._version = version
+            self._cache.clear()
+        return self._snapshot
+
+    def _mileage_curves(self, snapshot: Dict[str, np.ndarray],
+                        as_of: date) -> Dict[str, np.ndarray]:
+        """
+        Build mileage curve segments, grouped by car, from readings up to as_of
+
+        Each point starts a segment with a precomputed slope in miles per day
+        towards the car's next point, or the car's lifetime average rate after
+        its last point.
+        """
+        count = len(snapshot['years'])
+        known = snapshot['reading_days'] <= as_of.toordinal()
+
+        # Origin points go first so they sort before same-day readings
+        cars = np.concatenate([np.arange(count), snapshot['reading_cars'][known]])
+        days = np.concatenate([snapshot['origin_days'], snapshot['reading_days'][known]])
+        miles = np.concatenate([np.zeros(count), snapshot['reading_miles'][known]])
+        order = np.lexsort((days, cars))
+        cars, days, miles = cars[order], days[order], miles[order]
+
+        # Every car has at least its origin point, so groups are never empty
+        first = np.searchsorted(cars, np.arange(count), side='left')
+        last = np.searchsorted(cars, np.arange(count), side='right') - 1
+
+        # Lifetime average rate from the origin to the last known reading
+        elapsed = days[last] - snapshot['origin_days']
+        rates = np.full(count, DEFAULT_DAILY_MILEAGE)
+        has_trend = elapsed > 0
+        rates[has_trend] = miles[last][has_trend] / elapsed[has_trend]
+
+        next_days = np.full(len(days), np.iinfo(np.int64).max)
+        slopes = rates[cars]
+        same_car = cars[1:] == cars[:-1]
+        next_days[:-1][same_car] = days[1:][same_car]
+        span = (days[1:] - days[:-1])[same_car]
+        gained = (miles[1:] - miles[:-1])[same_car]
+        slopes[:-1][same_car] = np.divide(gained, span, out=np.zeros_like(gained),
+                                          where=span > 0)
+
+        return {'days': days, 'miles': miles, 'slopes': slopes,
+                'next_days': next_days, 'first': first}
+
+    def _value_at(self, snapshot: Dict[str, np.ndarray],
+                  curves: Dict[str, np.ndarray], segments: Dict[str, np.ndarray],
+                  month: date) -> Tuple[float, int, float]:
+        """
+        Get total value, car count and average mileage at a given date
+
+        segments holds each car's current curve segment and is advanced in
+        place, so months must be valued in increasing order.
+        """
+        day = month.toordinal()
+        advance = segments['next_day'] <= day
+        while advance.any():
+            point = segments['point'][advance] + 1
+            segments['point'][advance] = point
+            for name, column in (('day', 'days'), ('mile', 'miles'),
+                                 ('slope', 'slopes'), ('next_day', 'next_days')):
+                segments[name][advance] = curves[column][point]
+            advance = segments['next_day'] <= day
+
+        in_fleet = snapshot['origin_days'] <= day
+        fleet_size = int(np.count_nonzero(in_fleet))
+        if fleet_size == 0:
+            return 0.0, 0, 0.0
+
+        mileage = segments['mile'] + (day - segments['day']) * segments['slope']
+        age = np.maximum(month.year - snapshot['years'], 0)
+        depreciation = np.minimum(age * AGE_DEPRECIATION_RATE
+                                  + (mileage / 1000) * MILEAGE_DEPRECIATION_RATE,
+                                  MAX_DEPRECIATION)
+        values = snapshot['prices'] * (1 - depreciation)
+        total_value = float(values.sum(where=in_fleet))
+        average_mileage = float(mileage.sum(where=in_fleet)) / fleet_size
+        return total_value, fleet_size, average_mileage
+
+    def value_by_month(self, start: date, end: date, version: int,
+                       as_of: Optional[date] = None) -> pd.DataFrame:
+        """
+        Compute fleet value and mileage on the first day of each month
+
+        Args:
+            start: First month of the range
+            end: Last month of the range (inclusive)
+            version: Inventory version; the most recent CACHE_SIZE results are
+                reused while it is unchanged
+            as_of: Only odometer readings up to this date are used (default: today)
+
+        Returns:
+            DataFrame with 'month', 'total_value', 'cars' and 'average_mileage'
+            columns, one row per month
+        """
+        as_of = as_of or date.today()
+        start, end = _month_start(start), _month_start(end)
+        snapshot = self._get_snapshot(version)
+        key = (as_of, start, end)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+        else:
+            curves = self._mileage_curves(snapshot, as_of)
+            first = curves['first']
+            segments = {
+                'point': first.copy(),
+                'day': curves['days'][first],
+                'mile': curves['miles'][first],
+                'slope': curves['slopes'][first],
+                'next_day': curves['next_days'][first],
+            }
+            months = pd.date_range(start, end, freq='MS')
+            rows = [self._value_at(snapshot, curves, segments, month.date())
+                    for month in months]
+            self._cache[key] = pd.DataFrame({
+                'month': months,
+                'total_value': [row[0] for row in rows],
+                'cars': [row[1] for row in rows],
+                'average_mileage': [row[2] for row in rows],
+            })
+            if len(self._cache) > CACHE_SIZE:
+                self._cache.popitem(last=False)
+        return self._cache[key].copy()
@@ -1,8 +1,10 @@
 """
 Test script for the Car Management System
 """
+from datetime import date
 from car import Car
 from car_manager import CarManager
+from fleet_valuation import CACHE_SIZE
 
 
 def test_car_class():
@@ -63,6 +65,120 @@ def test_car_manager():
     print("\n✅ CarManager class tests passed!\n")
 
 
+def test_car_search():
+    """Test prefix and fuzzy search by make and model"""
+    print("Testing Car Search...")
+    print("-" * 50)
+
+    manager = CarManager()
+    manager.add_car(Car("Mercedes-Benz", "C-Class", 2021, "Silver", 48000, 22000))
+    manager.add_car(Car("Tesla", "Model 3", 2022, "White", 45000, 15000))
+    manager.add_car(Car("Toyota", "Camry", 2020, "Silver", 25000, 35000))
+    manager.add_car(Car("日産", "スカイライン", 2019, "Black", 30000, 40000))
+    manager.add_car(Car("Škoda", "Octavia", 2021, "Green", 24000, 20000))
+
+    merc = manager.search("merc", field='make')
+    print(f"'merc' matches: {[str(car) for car in merc]}")
+    assert [car.make for car in merc] == ["Mercedes-Benz"]
+
+    model3 = manager.search("Model3", field='model')
+    assert [car.model for car in model3] == ["Model 3"]
+
+    typo = manager.search("camri")
+    assert [car.model for car in typo] == ["Camry"]
+
+    assert [car.make for car in manager.search("日産")] == ["日産"]
+    assert [car.make for car in manager.search("skoda")] == ["Škoda"]
+
+    ranked = manager.search("t")
+    assert [car.make for car in ranked] == ["Tesla", "Toyota"]
+
+    assert manager.suggest("to") == ["Toyota"]
+    assert len(manager.search("t", limit=1)) == 1
+    assert manager.search("t", limit=0) == []
+    assert manager.suggest("t", limit=0) == []
+
+    manager.remove_car("Toyota", "Camry", 2020)
+    assert manager.search("toyota") == []
+    assert manager.suggest("to") == []
+
+    for query in ("", "toyota"):
+        try:
+            manager.search(query, field='color')
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("Unknown search field should raise ValueError")
+
+    print("\n✅ Car search tests passed!\n")
+
+
+def test_fleet_valuation():
+    """Test mileage history and fleet value projections"""
+    print("Testing Fleet Valuation...")
+    print("-" * 50)
+
+    manager = CarManager()
+    car = Car("Toyota", "Camry", 2020, "Silver", 20000, 0)
+    car.mileage_history = [(date(2020, 1, 1), 0.0)]
+    manager.add_car(car)
+    car.update_mileage(10000, date(2020, 11, 1))
+    print(f"Mileage history: {car.mileage_history}")
+    assert len(car.mileage_history) == 2
+
+    # Readings must be recorded in date order
+    try:
+        car.update_mileage(12000, date(2020, 6, 1))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Backdated mileage reading should raise ValueError")
+    assert car.mileage == 10000 and len(car.mileage_history) == 2
+
+    history = manager.get_value_history(date(2019, 12, 1), date(2021, 1, 15),
+                                        as_of=date(2021, 1, 1))
+    print(history.tail(3))
+    assert len(history) == 14
+    assert history['cars'].tolist() == [0] + [1] * 13
+
+    # Interpolated between readings, then projected at the lifetime rate
+    assert history['average_mileage'].iloc[11] == 10000
+    assert history['average_mileage'].iloc[13] > 10000
+    assert history['total_value'].iloc[1] == 20000
+    assert history['total_value'].iloc[1:].is_monotonic_decreasing
+
+    # Results are cached until the inventory changes
+    assert manager.get_value_history(date(2019, 12, 1), date(2021, 1, 1),
+                                     as_of=date(2021, 1, 1)).equals(history)
+    for month in range(1, 13):
+        manager.get_value_history(date(2020, month, 1), date(2021, 1, 1))
+    assert len(manager.valuation._cache) == CACHE_SIZE
+    manager.add_car(Car("Honda", "Civic", 2021, "Blue", 22000, 25000))
+    updated = manager.get_value_history(date(2019, 12, 1), date(2021, 1, 1),
+                                        as_of=date(2021, 1, 1))
+    assert updated['cars'].iloc[-1] == 2
+
+    # Mileage updates made directly on a car also refresh the cache
+    car.update_mileage(30000, date(2020, 12, 1))
+    updated = manager.get_value_history(date(2019, 12, 1), date(2021, 1, 1),
+                                        as_of=date(2021, 1, 1))
+    assert updated['average_mileage'].iloc[12] > history['average_mileage'].iloc[12]
+
+    # Next year's models count from their first reading, not from January 1st
+    manager = CarManager()
+    new_model = Car("Tesla", "Model Y", 2027, "White", 50000, 10)
+    new_model.mileage_history = [(date(2026, 10, 1), 10.0)]
+    manager.add_car(new_model)
+    history = manager.get_value_history(date(2026, 9, 1), date(2027, 1, 1),
+                                        as_of=date(2026, 10, 1))
+    assert history['cars'].tolist() == [0, 1, 1, 1, 1]
+    assert history['average_mileage'].iloc[1] == 10
+    assert history['average_mileage'].iloc[4] > 10
+    assert (history['total_value'].iloc[1:] <= 50000).all()
+
+    print("\n✅ Fleet valuation tests passed!\n")
+
+
 if __name__ == "__main__":
     print("\n" + "=" * 50)
     print("CAR MANAGEMENT SYSTEM - TESTS")
@@ -70,6 +186,8 @@ if __name__ == "__main__":
 
     test_car_class()
     test_car_manager()
+    test_car_search()
+    test_fleet_valuation()
 
     print("=" * 50)
     print("All tests completed successfully! ✅")